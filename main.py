@@ -39,7 +39,19 @@ SENSOR_SCK = 34  # GPIO SPI Clock (FPGA pin
 SENSOR_MISO = 32  # GPIO Master In (Sensor to FPGA/RP2350) (FPGA pin )
 
 # ==========================================
-# 2. FPGA LOADER
+# 2. SENSOR CONFIGURATION & TIMING
+# ==========================================
+
+# CTRL1_XL: ODR_XL = 0b0101 (208 Hz), FS_XL = 0b11 (±8 g), LPF2 disabled.
+# ACCEL_PERIOD_US must match the ODR selected here. Polling faster only re-reads
+# the same sample, which the FPGA would filter as a new measurement. The pacing is
+# approximate: the sensor's own oscillator sets the real ODR and drifts against
+# the RP2350 clock, so an occasional duplicate or missed sample still gets through.
+CTRL1_XL_208HZ = 0x5C
+ACCEL_PERIOD_US = 4808  # 1 / 208 Hz
+
+# ==========================================
+# 3. FPGA LOADER
 # ==========================================
 
 
@@ -80,7 +92,7 @@ def load_bitstream(filename):
 
 
 # ==========================================
-# 3. SENSOR INITIALIZATION (Shared SPI)
+# 4. SENSOR INITIALIZATION (Shared SPI)
 # ==========================================
 
 
@@ -124,18 +136,36 @@ def init_sensor():
         cs.value(1)
         return val[0]
 
-    def read_accel():
+    # Preallocated buffers for the polling loop so no bytearray is built per sample
+    accel_cmd = bytes([0x28 | 0x80])  # OUTX_L_A with R/W bit set (Read)
+    accel_buf = bytearray(2)
+
+    def read_accel(buf=accel_buf):
         cs.value(0)
-        spi.write(bytearray([0x28 | 0x80]))
-        data = spi.read(2)
+        spi.write(accel_cmd)
+        spi.readinto(buf)  # Burst-read len(buf) bytes from OUTX_L_A
         cs.value(1)
-        return data
+        return buf
 
     write_reg(0x12, 0x01)  # Software RESET
     time.sleep_ms(30)
-    write_reg(0x10, 0x5C)  # Config. Accel.
+    write_reg(0x10, CTRL1_XL_208HZ)  # Config. Accel.
+
+    # Pace reads off an absolute deadline on the monotonic microsecond clock so
+    # per-iteration jitter does not accumulate into the host-side cadence.
+    deadline = time.ticks_add(time.ticks_us(), ACCEL_PERIOD_US)
     while True:
+        remaining = time.ticks_diff(deadline, time.ticks_us())
+        if remaining > 0:
+            time.sleep_us(remaining)
         data = read_accel()
+        now = time.ticks_us()
+        if time.ticks_diff(now, deadline) >= ACCEL_PERIOD_US:
+            # Stalled for over a period (GC, USB/REPL): re-anchor instead of
+            # bursting catch-up reads the FPGA would take as fresh samples.
+            deadline = time.ticks_add(now, ACCEL_PERIOD_US)
+        else:
+            deadline = time.ticks_add(deadline, ACCEL_PERIOD_US)
     """
     whoami = read_reg(0x0F)
     if whoami != 0x6B:
@@ -143,31 +173,27 @@ def init_sensor():
         return
     print("Success: WHO_AM_I 0x6B")
     print("Accel loop: Rotate to test (Ctrl+C stop)")
+    import struct
+
+    # Full X/Y/Z burst (OUTX_L_A..OUTZ_H_A), separate from the 2-byte FPGA read
+    xyz_buf = bytearray(6)
+
+    # Scale to g (±8 g mode, FS_XL = 0b11)
+    sensitivity = 16 / 65536
+    count = 0
     try:
         while True:
-            data = read_accel()
-            # Raw unsigned 16-bit
-            x_raw = int.from_bytes(data[0:2], 'little')
-            y_raw = int.from_bytes(data[2:4], 'little')
-            z_raw = int.from_bytes(data[4:6], 'little')
-
-            # Manual signed conversion (for 16-bit two's complement)
-            def to_signed(n, bits=16):
-                if n >= (1 << (bits - 1)):
-                    n -= (1 << bits)
-                return n
-
-            x_raw = to_signed(x_raw)
-            y_raw = to_signed(y_raw)
-            z_raw = to_signed(z_raw)
-
-            # Scale to g (±4 g mode)
-            sensitivity = 8/65536
-            x = x_raw * sensitivity
-            y = y_raw * sensitivity
-            z = z_raw * sensitivity
-            
-            print(f"X:{x:.3f} Y:{y:.3f} Z:{z:.3f} | Raw: {data.hex()}")
+            data = read_accel(xyz_buf)
+            count += 1
+
+            # Only decode and print every 64th sample so the REPL doesn't throttle the loop
+            if count & 0x3F == 0:
+                # Signed 16-bit little-endian X, Y, Z in one call
+                x_raw, y_raw, z_raw = struct.unpack("<hhh", data)
+                x = x_raw * sensitivity
+                y = y_raw * sensitivity
+                z = z_raw * sensitivity
+                print(f"X:{x:.3f} Y:{y:.3f} Z:{z:.3f} | Raw: {data.hex()}")
             time.sleep_ms(2)
     except KeyboardInterrupt:
         print("Stopped")